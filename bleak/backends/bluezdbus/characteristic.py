@@ -81,9 +81,8 @@ class BleakGATTCharacteristicBlueZDBus(BleakGATTCharacteristic):
             if isinstance(specifier, int):
                 return next(filter(lambda x: x.handle == specifier, self.descriptors))
             else:
-                return next(
-                    filter(lambda x: x.uuid == str(specifier), self.descriptors)
-                )
+                _specifier = str(specifier)
+                return next(filter(lambda x: x.uuid == _specifier, self.descriptors))
         except StopIteration:
             return None
 
@@ -53,6 +53,7 @@ _GattCharacteristicsPropertiesEnum = {
         "The characteristic has writable auxiliaries",
     ),
 }
+_GattCharacteristicsPropertiesBits = tuple(2 ** n for n in range(10))
 
 
 class BleakGATTCharacteristicCoreBluetooth(BleakGATTCharacteristic):
@@ -64,7 +65,7 @@ class BleakGATTCharacteristicCoreBluetooth(BleakGATTCharacteristic):
         # self.__props = obj.properties()
         self.__props = [
             _GattCharacteristicsPropertiesEnum[v][0]
-            for v in [2 ** n for n in range(10)]
+            for v in _GattCharacteristicsPropertiesBits
             if (self.obj.properties() & v)
         ]
         self._uuid = cb_uuid_to_str(self.obj.UUID())
@@ -106,9 +107,8 @@ class BleakGATTCharacteristicCoreBluetooth(BleakGATTCharacteristic):
             if isinstance(specifier, int):
                 return next(filter(lambda x: x.handle == specifier, self.descriptors))
             else:
-                return next(
-                    filter(lambda x: x.uuid == str(specifier), self.descriptors)
-                )
+                _specifier = str(specifier)
+                return next(filter(lambda x: x.uuid == _specifier, self.descriptors))
         except StopIteration:
             return None
 
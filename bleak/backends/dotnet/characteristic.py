@@ -38,6 +38,7 @@ _GattCharacteristicsPropertiesEnum = {
         "The characteristic has writable auxiliaries",
     ),
 }
+_GattCharacteristicsPropertiesBits = tuple(2 ** n for n in range(10))
 
 
 class BleakGATTCharacteristicDotNet(BleakGATTCharacteristic):
@@ -50,7 +51,7 @@ class BleakGATTCharacteristicDotNet(BleakGATTCharacteristic):
         ]
         self.__props = [
             _GattCharacteristicsPropertiesEnum[v][0]
-            for v in [2 ** n for n in range(10)]
+            for v in _GattCharacteristicsPropertiesBits
             if (self.obj.CharacteristicProperties & v)
         ]
 
@@ -92,9 +93,8 @@ class BleakGATTCharacteristicDotNet(BleakGATTCharacteristic):
             if isinstance(specifier, int):
                 return next(filter(lambda x: x.handle == specifier, self.descriptors))
             else:
-                return next(
-                    filter(lambda x: x.uuid == str(specifier), self.descriptors)
-                )
+                _specifier = str(specifier)
+                return next(filter(lambda x: x.uuid == _specifier, self.descriptors))
         except StopIteration:
             return None
 
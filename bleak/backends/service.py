@@ -67,10 +67,9 @@ class BleakGATTService(abc.ABC):
             The first characteristic matching ``uuid`` or ``None`` if no
             matching characteristic was found.
         """
+        _uuid = str(uuid).lower()
         try:
-            return next(
-                filter(lambda x: x.uuid == str(uuid).lower(), self.characteristics)
-            )
+            return next(filter(lambda x: x.uuid == _uuid, self.characteristics))
         except StopIteration:
             return None
 
@@ -168,10 +167,11 @@ class BleakGATTServiceCollection(object):
         if isinstance(specifier, int):
             return self.characteristics.get(specifier, None)
         else:
+            _specifier = str(specifier).lower()
             # Assume uuid usage.
             x = list(
                 filter(
-                    lambda x: x.uuid == str(specifier).lower(),
+                    lambda x: x.uuid == _specifier,
                     self.characteristics.values(),
                 )
             )